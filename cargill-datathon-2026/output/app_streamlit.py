@@ -1,16 +1,11 @@
 from __future__ import annotations
+import os
+import time
+import threading
+from collections import namedtuple
 import streamlit as st
-import pandas as pd
 import numpy as np
-import requests 
-import json
-from freight_api import load_data, get_risk_report
-
-from voyage_economics import (
-    run_partial_voyage,
-    find_delay_threshold,
-    find_bunker_price_threshold,
-)
+from freight_api import load_data, get_risk_report, top_k_indices
 
 # ---------------- Page config ----------------
 st.set_page_config(
@@ -27,9 +22,108 @@ st.caption(
 )
 
 # ---------------- Load data ----------------
-DATA = load_data(".")
+DATA_DIR = "."
+DATA_FILES = (
+    "freight_calculator_all_combinations.parquet",
+    "freight_calculator_all_combinations.csv",
+    "freight_calculator_assignments.csv",
+    "freight_calculator_scenarios.csv",
+)
+
+
+def _data_key(base_path):
+    """Small hashable key for the data files: (path, mtime) of each one."""
+    key = []
+    for name in DATA_FILES:
+        path = os.path.join(base_path, name)
+        key.append((path, os.path.getmtime(path) if os.path.exists(path) else None))
+    return tuple(key)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_data(base_path, key):
+    # DataFrames are expensive to hash, so the raw frames live in cache_resource
+    # and are invalidated by the mtime key instead.
+    data = load_data(base_path)
+    results = data.get("results_df")
+    if results is not None and {"vessel", "cargo"} <= set(results.columns):
+        # Categorical codes make equality masks integer compares and uniques O(1)
+        data = dict(data, results_df=results.assign(
+            vessel=results["vessel"].astype("category"),
+            cargo=results["cargo"].astype("category"),
+        ))
+    return data
+
+
+@st.cache_data(show_spinner=False)
+def _sidebar_options(base_path, key):
+    df = _load_data(base_path, key)["results_df"]
+    vessel_list = df["vessel"].cat.categories.tolist()
+    cargo_list = df["cargo"].cat.categories.tolist()
+    default_vlsfo = (
+        float(df["vlsfo_price"].median())
+        if "vlsfo_price" in df.columns
+        else 490.0
+    )
+    return vessel_list, cargo_list, default_vlsfo
+
+
+NUMERIC_COLS = (
+    "profit",
+    "tce",
+    "days",
+    "vlsfo_price",
+    "mgo_price",
+    "total_vlsfo_mt",
+    "total_mgo_mt",
+    "speed_knots",
+)
+REQUIRED_COLS = ("vessel", "cargo") + tuple(c for c in NUMERIC_COLS if c != "speed_knots")
+DEFAULT_SPEED_KNOTS = 12.0  # same default as run_partial_voyage
+# Dollar totals keep float64; the rest is stored as float32 to halve memory traffic
+FLOAT64_COLS = ("profit",)
+
+# One results_df row, built from the SoA arrays
+Row = namedtuple("Row", ("vessel", "cargo") + NUMERIC_COLS + ("base_bunker_cost",))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _soa(base_path, key):
+    """Structure-of-arrays view of results_df: one contiguous numpy array per column."""
+    df = _load_data(base_path, key)["results_df"]
+    soa = {
+        c: df[c].to_numpy(dtype=np.float64 if c in FLOAT64_COLS else np.float32)
+        for c in NUMERIC_COLS
+        if c in df.columns
+    }
+    soa.setdefault("speed_knots", np.full(len(df), DEFAULT_SPEED_KNOTS, dtype=np.float32))
+    # Bunker cost at each row's own prices never depends on user input (computed at full precision)
+    soa["base_bunker_cost"] = (
+        df["vlsfo_price"] * df["total_vlsfo_mt"] + df["mgo_price"] * df["total_mgo_mt"]
+    ).to_numpy(dtype=np.float64)
+    soa["vessel"] = df["vessel"].to_numpy()
+    soa["cargo"] = df["cargo"].to_numpy()
+    return soa
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _row_index(base_path, key):
+    """(vessel, cargo) -> first matching row position, for O(1) lookups."""
+    soa = _soa(base_path, key)
+    index = {}
+    for i, pair in enumerate(zip(soa["vessel"], soa["cargo"])):
+        index.setdefault(pair, i)
+    return index
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _risk_report(base_path):
+    return get_risk_report(base_path)
+
+
+DATA_KEY = _data_key(DATA_DIR)
+DATA = _load_data(DATA_DIR, DATA_KEY)
 results_df = DATA.get("results_df")
-assignments_df = DATA.get("assignments_df")
 
 if results_df is None or results_df.empty:
     st.warning(
@@ -38,82 +132,176 @@ if results_df is None or results_df.empty:
     )
     st.stop()
 
+missing_cols = [c for c in REQUIRED_COLS if c not in results_df.columns]
+if missing_cols:
+    st.warning(f"Precomputed data is missing required columns: {', '.join(missing_cols)}.")
+    st.stop()
+
+SOA = _soa(DATA_DIR, DATA_KEY)
+ROW_INDEX = _row_index(DATA_DIR, DATA_KEY)
+
 # ---------------- Sidebar ----------------
 with st.sidebar:
     st.header("🔧 Inputs")
 
-    vessel_list = sorted(results_df["vessel"].unique().tolist())
-    cargo_list = sorted(results_df["cargo"].unique().tolist())
+    vessel_list, cargo_list, default_vlsfo = _sidebar_options(DATA_DIR, DATA_KEY)
 
-    vessel = st.selectbox("Vessel", vessel_list)
-    cargo = st.selectbox("Cargo / Route", cargo_list)
+    # Inputs are batched in a form: the script reruns only on submit
+    with st.form("inputs"):
+        vessel = st.selectbox("Vessel", vessel_list)
+        cargo = st.selectbox("Cargo / Route", cargo_list)
 
-    st.divider()
-
-    default_vlsfo = (
-        float(results_df["vlsfo_price"].median())
-        if "vlsfo_price" in results_df.columns
-        else 490.0
-    )
-
-    # VLSFO input
-    vlsfo_price = st.number_input(
-        "VLSFO Price ($/MT)",
-        value=default_vlsfo,
-        step=1.0,
-    )
+        st.divider()
 
-    # MGO input with session state fix
-    if "mgo_price" not in st.session_state:
-        st.session_state.mgo_price = float(vlsfo_price * 1.3)
+        # VLSFO input
+        vlsfo_price = st.number_input(
+            "VLSFO Price ($/MT)",
+            value=default_vlsfo,
+            step=1.0,
+        )
 
-    mgo_price = st.number_input(
-        "MGO Price ($/MT)",
-        value=st.session_state.mgo_price,
-        step=1.0,
-    )
+        # MGO input: default seeded once, then owned by the keyed widget
+        if "mgo_price" not in st.session_state:
+            st.session_state.mgo_price = float(vlsfo_price * 1.3)
 
-    # Update session state when user edits MGO
-    st.session_state.mgo_price = mgo_price
+        mgo_price = st.number_input(
+            "MGO Price ($/MT)",
+            step=1.0,
+            key="mgo_price",
+        )
 
-    speed_knots = st.slider(
-        "Speed (knots)",
-        min_value=9.0,
-        max_value=16.0,
-        value=12.0,
-        step=0.5,
-    )
+        speed_knots = st.slider(
+            "Speed (knots)",
+            min_value=9.0,
+            max_value=16.0,
+            value=12.0,
+            step=0.5,
+        )
 
-    extra_days = st.number_input(
-        "Extra Waiting Days",
-        min_value=0.0,
-        max_value=30.0,
-        value=0.0,
-        step=0.5,
-    )
+        extra_days = st.number_input(
+            "Extra Waiting Days",
+            min_value=0.0,
+            max_value=30.0,
+            value=0.0,
+            step=0.5,
+        )
 
-submitted = st.button("🚀 Compute Recommendation", use_container_width=True)
+        submitted = st.form_submit_button("🚀 Compute Recommendation", use_container_width=True)
 
 # ---------------- Helper ----------------
-def compute_adjusted_profit(row, vlsfo_new, mgo_new):
-    orig_profit = float(row.get("profit", 0))
-    vlsfo_orig = float(row.get("vlsfo_price", vlsfo_new))
-    mgo_orig = float(row.get("mgo_price", mgo_new))
-    total_vlsfo = float(row.get("total_vlsfo_mt", 0))
-    total_mgo = float(row.get("total_mgo_mt", 0))
-    days = float(row.get("days", 1)) or 1.0
-
-    delta = (vlsfo_new - vlsfo_orig) * total_vlsfo + (mgo_new - mgo_orig) * total_mgo
-    adj_profit = orig_profit - delta
+def compute_adjusted_profit(row: Row, vlsfo_new, mgo_new):
+    days = float(row.days) or 1.0
+
+    bunker_new = vlsfo_new * row.total_vlsfo_mt + mgo_new * row.total_mgo_mt
+    adj_profit = float(row.profit - bunker_new + row.base_bunker_cost)
     adj_tce = adj_profit / days if days > 0 else 0.0
 
     return {
-        "orig_profit": orig_profit,
+        "orig_profit": float(row.profit),
         "adj_profit": adj_profit,
-        "orig_tce": float(row.get("tce", 0)),
+        "orig_tce": float(row.tce),
         "adj_tce": adj_tce,
         "days": days,
     }
+
+
+# run_partial_voyage result key -> compute_adjusted_profit key used when it is missing
+FALLBACK_KEYS = {
+    "adj_profit": "adj_profit",
+    "adj_tce": "adj_tce",
+    "profit": "adj_profit",
+    "tce": "adj_tce",
+    "days": "days",
+}
+
+
+def recommend_action(adj_profit, orig_profit):
+    """ASSIGN if still profitable, HEDGE if within 5% of the original profit, else DECLINE."""
+    adj_profit = np.asarray(adj_profit)
+    return np.where(
+        adj_profit >= 0,
+        "ASSIGN",
+        np.where(adj_profit > -0.05 * np.maximum(1.0, orig_profit), "HEDGE", "DECLINE"),
+    )
+
+
+def rank_assignments(soa, vlsfo_price, mgo_price, speed_knots, extra_days, k=10):
+    """Adjusted profit/TCE for every row in one kernel pass, then the top-k rows and their actions."""
+    from voyage_economics import run_partial_voyage_batch
+
+    batch = run_partial_voyage_batch(
+        soa,
+        vlsfo_price=vlsfo_price,
+        mgo_price=mgo_price,
+        speed_knots=speed_knots,
+        extra_days=extra_days,
+        fuel=False,
+    )
+    idx = top_k_indices(batch["adj_profit"], k)
+    adj_profit = batch["adj_profit"][idx]
+    return idx, adj_profit, batch["adj_tce"][idx], recommend_action(adj_profit, soa["profit"][idx])
+
+
+# ---------------- Chatbot helpers ----------------
+OLLAMA_URL = "http://localhost:11434/api/generate"
+OLLAMA_MODEL = "tinyllama"
+CHAT_CACHE_TTL = 3600  # seconds
+CHAT_CACHE_MAX_ENTRIES = 256
+
+
+@st.cache_resource(show_spinner=False)
+def _http():
+    """Shared keep-alive session so chat turns reuse the Ollama connection."""
+    import requests
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def _chat_cache():
+    """(prompt, model) -> (timestamp, response) for repeated chatbot queries, oldest first.
+
+    Shared by every session, so writes go through _store_chat_response under the lock.
+    """
+    return {}, threading.Lock()
+
+
+def _cached_chat_response(prompt, model):
+    entries, _ = _chat_cache()
+    hit = entries.get((prompt, model))
+    if hit is not None and time.time() - hit[0] < CHAT_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _store_chat_response(prompt, model, response):
+    """Insert a response, dropping expired entries and then the oldest beyond the size cap."""
+    entries, lock = _chat_cache()
+    now = time.time()
+    with lock:
+        entries.pop((prompt, model), None)
+        entries[(prompt, model)] = (now, response)
+        # Insertion order is age order, so expired entries sit at the front
+        for key in list(entries):
+            if len(entries) <= CHAT_CACHE_MAX_ENTRIES and now - entries[key][0] < CHAT_CACHE_TTL:
+                break
+            del entries[key]
+
+
+def _iter_ollama_tokens(response):
+    """Yield text chunks from an Ollama streaming (NDJSON) response."""
+    import json
+
+    for line in response.iter_lines():
+        if not line:
+            continue
+        chunk = json.loads(line)
+        yield chunk.get("response", "")
+        if chunk.get("done"):
+            break
 # ---------------- Main content ----------------
 # Persist 'submitted' state in session_state
 if "submitted" not in st.session_state:
@@ -122,45 +310,53 @@ if "submitted" not in st.session_state:
 if submitted:
     st.session_state.submitted = True
 
-current_sig = (vessel, cargo, vlsfo_price, mgo_price, speed_knots, extra_days)
+# DATA_KEY changes when the CSVs are reloaded, which drops the cached results too
+sig_selection = (DATA_KEY, vessel, cargo)
+sig_scalar = (DATA_KEY, vlsfo_price, mgo_price, speed_knots, extra_days)
+
+# If inputs changed, clear only the cached results that depend on them:
+# the selected-row calc depends on both, the Top-10 ranking only on the scalars.
+if st.session_state.get("last_sig_selection") != sig_selection:
+    st.session_state.last_sig_selection = sig_selection
+    st.session_state.pop("selected_row", None)
+    st.session_state.pop("adjusted", None)
 
-    # If inputs changed, clear cached results
-if st.session_state.get("last_sig") != current_sig:
-        st.session_state.last_sig = current_sig
-        st.session_state.pop("adjusted", None)
-        st.session_state.pop("selected_row", None)
+if st.session_state.get("last_sig_scalar") != sig_scalar:
+    st.session_state.last_sig_scalar = sig_scalar
+    st.session_state.pop("adjusted", None)
+    st.session_state.pop("top10", None)
 
 if st.session_state.submitted:
+    # Deferred until first use; later reruns hit sys.modules
+    from voyage_economics import run_partial_voyage
+
     # Ensure the selected row is persisted
     if "selected_row" not in st.session_state:
-        mask = (results_df["vessel"] == vessel) & (results_df["cargo"] == cargo)
-        if not mask.any():
+        i = ROW_INDEX.get((vessel, cargo))
+        if i is None:
             st.error("No matching vessel–cargo combination found.")
             st.stop()
-        st.session_state.selected_row = results_df[mask].iloc[0].to_dict()
+        st.session_state.selected_row = Row(*(SOA[c][i] for c in Row._fields))
     
     row = st.session_state.selected_row
 
     # Compute adjusted values if not already persisted
     if "adjusted" not in st.session_state:
         adjusted = run_partial_voyage(
-            base_row=row,
+            base_row=row._asdict(),
             vlsfo_price=vlsfo_price,
             mgo_price=mgo_price,
             speed_knots=speed_knots,
             extra_days=extra_days,
         )
 
-        # Fallback for missing keys
-        if "adj_profit" not in adjusted:
+        # Fallback for missing keys: compute_adjusted_profit runs at most once,
+        # and only if run_partial_voyage left something out
+        missing = [key for key in FALLBACK_KEYS if key not in adjusted]
+        if missing:
             comp = compute_adjusted_profit(row, vlsfo_price, mgo_price)
-            adjusted.setdefault("adj_profit", comp["adj_profit"])
-            adjusted.setdefault("adj_tce", comp["adj_tce"])
-            adjusted.setdefault("orig_profit", comp["orig_profit"])
-            adjusted.setdefault("orig_tce", comp["orig_tce"])
-            adjusted.setdefault("profit", comp["adj_profit"])
-            adjusted.setdefault("tce", comp["adj_tce"])
-            adjusted.setdefault("days", comp["days"])
+            for key in missing:
+                adjusted[key] = comp[FALLBACK_KEYS[key]]
 
         st.session_state.adjusted = adjusted
     else:
@@ -179,11 +375,11 @@ if st.session_state.submitted:
 
         st.divider()
 
-        adj_profit = adjusted.get("adj_profit", 0)
-        orig_profit = adjusted.get("orig_profit", 1)
-        if adj_profit >= 0:
+        # Baseline read from the current row, so it follows selected_row when it is rebuilt
+        action = recommend_action(adjusted.get("adj_profit", 0), float(row.profit))
+        if action == "ASSIGN":
             st.success("✅ **RECOMMENDATION: ASSIGN**")
-        elif adj_profit > -0.05 * max(1.0, orig_profit):
+        elif action == "HEDGE":
             st.warning("⚠️ **RECOMMENDATION: HEDGE / CAUTION**")
         else:
             st.error("❌ **RECOMMENDATION: DECLINE**")
@@ -192,61 +388,80 @@ if st.session_state.submitted:
     with tab2:
         st.subheader("Top 10 Assignments (Ranked by Adjusted Profit)")
 
-        top_df = results_df.copy()
-
-        # Compute adjusted profit & tce using all inputs
-        def compute_row(row):
-            adjusted = run_partial_voyage(
-                base_row=row.to_dict(),
-                vlsfo_price=vlsfo_price,
-                mgo_price=mgo_price,
-                speed_knots=speed_knots,
-                extra_days=extra_days,
+        # Rank every row by adjusted profit in one fused pass; the ranking
+        # only depends on the scalar inputs, so it survives selection changes.
+        if "top10" not in st.session_state:
+            idx, adj_profit_k, adj_tce_k, action_k = rank_assignments(
+                SOA, vlsfo_price, mgo_price, speed_knots, extra_days, k=10
+            )
+            st.session_state.top10 = {
+                "idx": idx,
+                "adj_profit": adj_profit_k,
+                "adj_tce": adj_tce_k,
+                "action": action_k,
+            }
+        top10 = st.session_state.top10
+
+        # Selected first (values from the selected-row calc), then the rest of the top-10
+        sel = ROW_INDEX.get((vessel, cargo))
+        if sel is None:
+            st.warning("Selected vessel–cargo combination is not in the current data.")
+            top_df = results_df.iloc[top10["idx"]].assign(
+                adj_profit=top10["adj_profit"],
+                adj_tce=top10["adj_tce"],
+                action=top10["action"],
+                selected=False,
+            )
+        else:
+            keep = top10["idx"] != sel
+            k = min(10, len(SOA["profit"]))
+            top_idx = np.concatenate([[sel], top10["idx"][keep]])[:k]
+
+            top_df = results_df.iloc[top_idx].assign(
+                adj_profit=np.concatenate([[adjusted["adj_profit"]], top10["adj_profit"][keep]])[:k],
+                adj_tce=np.concatenate([[adjusted["adj_tce"]], top10["adj_tce"][keep]])[:k],
+                action=np.concatenate([[action], top10["action"][keep]])[:k],
+                selected=top_idx == sel,
             )
-            if adjusted:
-                adj_profit = adjusted.get("adj_profit", compute_adjusted_profit(row, vlsfo_price, mgo_price)["adj_profit"])
-                adj_tce = adjusted.get("adj_tce", compute_adjusted_profit(row, vlsfo_price, mgo_price)["adj_tce"])
-            else:
-                comp = compute_adjusted_profit(row, vlsfo_price, mgo_price)
-                adj_profit = comp["adj_profit"]
-                adj_tce = comp["adj_tce"]
-            return pd.Series({"adj_profit": adj_profit, "adj_tce": adj_tce})
-
-        top_df[["adj_profit", "adj_tce"]] = top_df.apply(compute_row, axis=1)
-
-        # Add a flag for the selected vessel/cargo
-        top_df["selected"] = (top_df["vessel"] == vessel) & (top_df["cargo"] == cargo)
-
-        # Sort by selected first, then adj_profit descending
-        top_df = top_df.sort_values(["selected", "adj_profit"], ascending=[False, False]).head(10)
-
 
-        display_cols = ["vessel", "cargo", "adj_profit", "adj_tce", "days", "selected"]
+        display_cols = ["vessel", "cargo", "adj_profit", "adj_tce", "days", "action", "selected"]
         display_cols = [c for c in display_cols if c in top_df.columns]
 
+        # Formatting happens client-side so the columns stay float64 for Arrow
         st.dataframe(
-            top_df[display_cols].reset_index(drop=True),
+            top_df[display_cols],
             use_container_width=True,
             height=400,
+            hide_index=True,
+            column_config={
+                # Whole dollars with separators, like the tab 1 metrics ($2,450,220)
+                "adj_profit": st.column_config.NumberColumn("adj_profit", format="dollar", step=1),
+                "adj_tce": st.column_config.NumberColumn("adj_tce", format="dollar", step=1),
+                "days": st.column_config.NumberColumn("days", format="%.1f"),
+            },
         )
 
 
     # -------- TAB 3: Risk --------
     with tab3:
-        risk_report = get_risk_report(".")
+        risk_report = _risk_report(DATA_DIR)
         st.json(risk_report if isinstance(risk_report, dict) else {})
 
 
     # ---- TAB 4: Chatbot ----
     with tab4:
+        import requests
+
         st.subheader("🤖 Freight Decision AI Assistant")
 
+        # Lives and dies with the browser session; only responses are shared across sessions
         if "chat_history" not in st.session_state:
             st.session_state.chat_history = []
+        chat_history = st.session_state.chat_history
 
         chat_container = st.container()
         with chat_container:
-            for msg in st.session_state.chat_history:
+            for msg in chat_history:
                 with st.chat_message(msg["role"]):
                     st.write(msg["content"])
 
@@ -254,7 +469,7 @@ if st.session_state.submitted:
         user_input = st.chat_input("Ask about voyage recommendations...")
 
         if user_input:
-            st.session_state.chat_history.append({"role": "user", "content": user_input})
+            chat_history.append({"role": "user", "content": user_input})
             
             # Display user message immediately
             with st.chat_message("user"):
@@ -262,39 +477,48 @@ if st.session_state.submitted:
 
             current_rec = f"""
 Current Best Recommendation:
-- Vessel: {row.get('vessel', 'N/A')}
-- Cargo: {row.get('cargo', 'N/A')}
+- Vessel: {row.vessel}
+- Cargo: {row.cargo}
 - Adjusted Profit: ${adjusted.get('adj_profit', 0):,.0f}
 - Adjusted TCE: ${adjusted.get('adj_tce', 0):,.0f}
 - Voyage Days: {adjusted.get('days', 0):.1f}
 """
 
-            # Query Ollama
+            # Query Ollama (tokens are rendered as they arrive)
             with st.chat_message("assistant"):
                 status = st.empty()
-
-                with st.spinner("🤖 Generating response..."):
-                    try:
-                        response = requests.post(
-                            "http://localhost:11434/api/generate",
+                prompt = f"{current_rec}\nUser Query: {user_input}"
+                assistant_response = _cached_chat_response(prompt, OLLAMA_MODEL)
+
+                try:
+                    if assistant_response is not None:
+                        status.write(assistant_response)
+                    else:
+                        with _http().post(
+                            OLLAMA_URL,
                             json={
-                                "model": "tinyllama",
-                                "prompt": f"{current_rec}\nUser Query: {user_input}",
-                                "stream": False,
+                                "model": OLLAMA_MODEL,
+                                "prompt": prompt,
+                                "stream": True,
                             },
-                            timeout=30,
+                            stream=True,
+                            timeout=(3, 120),
+                        ) as response:
+                            if response.status_code == 200:
+                                assistant_response = st.write_stream(_iter_ollama_tokens(response))
+                                if not assistant_response:
+                                    assistant_response = "No response generated."
+                                    status.write(assistant_response)
+                                _store_chat_response(prompt, OLLAMA_MODEL, assistant_response)
+                            else:
+                                status.error(f"Ollama error: {response.status_code}")
+
+                    if assistant_response is not None:
+                        chat_history.append(
+                            {"role": "assistant", "content": assistant_response}
                         )
 
-                        if response.status_code == 200:
-                            assistant_response = response.json().get("response", "No response generated.")
-                            status.write(assistant_response)
-                            st.session_state.chat_history.append(
-                                {"role": "assistant", "content": assistant_response}
-                            )
-                        else:
-                            status.error(f"Ollama error: {response.status_code}")
-
-                    except requests.exceptions.ConnectionError:
-                        status.error("⚠️ Ollama not running.")
-                    except Exception as e:
-                        status.error(f"Error: {str(e)}")
\ No newline at end of file
+                except requests.exceptions.ConnectionError:
+                    status.error("⚠️ Ollama not running.")
+                except Exception as e:
+                    status.error(f"Error: {str(e)}")
\ No newline at end of file
@@ -6,30 +6,239 @@ Please have these
 """
 from __future__ import annotations
 import os
+import csv
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow  # noqa: F401  (multithreaded CSV parsing when available)
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
 
-def _read_csv_if_exists(path: str) -> Optional[pd.DataFrame]:
+# Opt-in Polars reader: FREIGHT_FAST_IO=1
+_FAST_IO = os.environ.get('FREIGHT_FAST_IO') == '1'
+
+# Columns of the combinations table used by the API, the app and voyage_economics.
+RESULTS_COLUMNS = [
+    'vessel', 'cargo', 'profit', 'tce', 'days', 'vlsfo_price', 'mgo_price',
+    'total_vlsfo_mt', 'total_mgo_mt', 'speed_knots',
+]
+# Assignment columns read by get_report / get_comparison / get_top5.
+ASSIGNMENTS_COLUMNS = [
+    'vessel', 'cargo', 'profit', 'tce', 'days', 'gross_revenue', 'net_revenue',
+    'bunker_cost', 'hire_cost', 'total_costs', 'profit_margin_pct',
+]
+SCENARIOS_COLUMNS = ['total_profit']
+
+# Parse hints for the numeric columns above; skips type inference, and integer-looking
+# columns (prices, small scenario files) come back as floats like the rest
+_DTYPES = {c: 'float64' for c in (
+    'profit', 'tce', 'days', 'vlsfo_price', 'mgo_price', 'total_vlsfo_mt', 'total_mgo_mt',
+    'speed_knots', 'gross_revenue', 'net_revenue', 'bunker_cost', 'hire_cost', 'total_costs',
+    'profit_margin_pct', 'total_profit',
+)}
+
+
+# (abspath, mtime, reader, args) -> DataFrame / array; entries are shared between callers,
+# treat them as read-only.
+_CACHE: Dict[tuple, Any] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(path: str, reader, args: tuple) -> Optional[tuple]:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), mtime, reader.__name__) + \
+        tuple(tuple(a) if isinstance(a, list) else a for a in args)
+
+
+def _cached_read(path: str, reader, *args) -> Any:
+    key = _cache_key(path, reader, args)
+    if key is None:
+        return None
+    result = _CACHE.get(key)
+    if result is None:
+        result = reader(key[0], *args)
+        if result is None:
+            return None
+        # load_data reads files from worker threads; the eviction scan must not race inserts
+        with _CACHE_LOCK:
+            # Drop entries for older versions of the same file
+            for old in [k for k in _CACHE if k[0] == key[0] and k[1] != key[1]]:
+                del _CACHE[old]
+            _CACHE[key] = result
+    return result
+
+
+def _csv_header(path: str) -> List[str]:
+    with open(path, newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def _read_csv_polars(path: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    import polars as pl
+    return pl.read_csv(path, columns=usecols).to_pandas(use_pyarrow_extension_array=False)
+
+
+def _read_csv(path: str, usecols: Optional[List[str]] = None,
+              dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    # Fast readers first; both return plain numpy-backed frames like the C engine
+    if _FAST_IO:
+        try:
+            df = _read_csv_polars(path, usecols)
+            return df.astype(dtype) if dtype else df
+        except Exception:
+            pass
+    if _CSV_ENGINE == 'pyarrow':
+        try:
+            return pd.read_csv(path, engine='pyarrow', usecols=usecols, dtype=dtype)
+        except Exception:
+            pass
+    return pd.read_csv(path, usecols=usecols, dtype=dtype)
+
+
+def _read_single_column_csv(path: str, colname: str, dtype=np.float64) -> Optional[np.ndarray]:
+    """One numeric CSV column as an array, without building a DataFrame."""
+    try:
+        header = _csv_header(path)
+        if colname not in header:
+            return None
+        idx = header.index(colname)
+        try:
+            return np.loadtxt(path, delimiter=',', quotechar='"', skiprows=1, usecols=(idx,),
+                              dtype=dtype, ndmin=1)
+        except (ValueError, TypeError):
+            # Empty cells, values loadtxt can't parse, or numpy < 1.23 (no quotechar)
+            return pd.read_csv(path, usecols=[colname])[colname].to_numpy(dtype=dtype)
+    except Exception:
+        return None
+
+
+def _read_parquet_if_exists(path: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
     try:
         if os.path.exists(path):
-            return pd.read_csv(path)
+            if columns is not None:
+                import pyarrow.parquet as pq
+                available = set(pq.read_schema(path).names)
+                columns = [c for c in columns if c in available]
+            return pd.read_parquet(path, columns=columns)
     except Exception:
         pass
     return None
 
 
+def _write_parquet_cache(df: pd.DataFrame, path: str) -> None:
+    # Best-effort (read-only dir, no pyarrow, mixed-type columns); written atomically
+    tmp = path + '.tmp'
+    try:
+        df.to_parquet(tmp, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_csv_if_exists(path: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """Read a CSV, or its sibling .cache.parquet copy when that is at least as new.
+
+    With ``columns``, only those (of the ones present) are parsed, with _DTYPES hints.
+    """
+    # Own suffix: the plain .parquet next to the combinations CSV is the notebook's export
+    pq_path = os.path.splitext(path)[0] + '.cache.parquet'
+    try:
+        csv_mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        header = _csv_header(path) if csv_mtime is not None else []
+        # CSV columns this read must return; every header column when unrestricted
+        wanted = header if columns is None else [c for c in header if c in columns]
+        if os.path.exists(pq_path) and (csv_mtime is None or os.path.getmtime(pq_path) >= csv_mtime):
+            df = _read_parquet_if_exists(pq_path, columns)
+            # A cache written for a narrower column set is stale
+            if df is not None and all(c in df.columns for c in wanted):
+                return df
+        if csv_mtime is not None:
+            usecols = dtype = None
+            if columns is not None:
+                usecols = wanted
+                dtype = {c: _DTYPES[c] for c in usecols if c in _DTYPES}
+            df = _read_csv(path, usecols, dtype)
+            _write_parquet_cache(df, pq_path)
+            if columns is not None:
+                df = df[[c for c in columns if c in df.columns]]
+            return df
+    except Exception:
+        pass
+    return None
+
+
+# load_data key -> (file name, reader, args) sources, tried in order
+_INPUTS = {
+    'results_df': [
+        # The notebook's Parquet export is preferred unless the CSV was written after it
+        ('freight_calculator_all_combinations.parquet', _read_parquet_if_exists, (RESULTS_COLUMNS,)),
+        ('freight_calculator_all_combinations.csv', _read_csv_if_exists, (RESULTS_COLUMNS,)),
+    ],
+    'assignments_df': [('freight_calculator_assignments.csv', _read_csv_if_exists, (ASSIGNMENTS_COLUMNS,))],
+    'scenarios_df': [('freight_calculator_scenarios.csv', _read_csv_if_exists, (SCENARIOS_COLUMNS,))],
+}
+
+
+def _fresh_sources(base_path: str, sources: list) -> list:
+    # (path, reader, args) in order, skipping a file that a later source is newer than
+    paths = [os.path.join(base_path, name) for name, _, _ in sources]
+    mtimes = [os.path.getmtime(p) if os.path.exists(p) else None for p in paths]
+    return [
+        (path, reader, args)
+        for i, (path, (_, reader, args)) in enumerate(zip(paths, sources))
+        if not any(m is not None and mtimes[i] is not None and m > mtimes[i] for m in mtimes[i + 1:])
+    ]
+
+
+def _load_input(base_path: str, sources: list) -> Optional[pd.DataFrame]:
+    for path, reader, args in _fresh_sources(base_path, sources):
+        df = _cached_read(path, reader, *args)
+        if df is not None:
+            return df
+    return None
+
+
+def _needs_read(base_path: str, sources: list) -> bool:
+    # Cold when the first source that exists on disk is not cached yet
+    for path, reader, args in _fresh_sources(base_path, sources):
+        key = _cache_key(path, reader, args)
+        if key is not None:
+            return key not in _CACHE
+    return False
+
+
 def load_data(base_path: str = '.') -> Dict[str, Optional[pd.DataFrame]]:
-    results = _read_csv_if_exists(os.path.join(base_path, 'freight_calculator_all_combinations.csv'))
-    assignments = _read_csv_if_exists(os.path.join(base_path, 'freight_calculator_assignments.csv'))
-    scenarios = _read_csv_if_exists(os.path.join(base_path, 'freight_calculator_scenarios.csv'))
-    return {
-        'results_df': results,
-        'assignments_df': assignments,
-        'scenarios_df': scenarios
-    }
+    cold = [k for k, sources in _INPUTS.items() if _needs_read(base_path, sources)]
+    data = {}
+    if len(cold) > 1:
+        # Parsing releases the GIL, so independent files overlap on a cold start
+        with ThreadPoolExecutor(max_workers=len(cold)) as ex:
+            futures = {k: ex.submit(_load_input, base_path, _INPUTS[k]) for k in cold}
+            data = {k: f.result() for k, f in futures.items()}
+    return {k: data[k] if k in data else _load_input(base_path, sources) for k, sources in _INPUTS.items()}
+
+
+def _column_values(s: pd.Series) -> List[Any]:
+    # Native Python scalars; NaN/inf become None like to_json
+    if s.dtype.kind == 'f':
+        arr = s.to_numpy()
+        bad = ~np.isfinite(arr)
+        if bad.any():
+            return np.where(bad, None, arr.astype(object)).tolist()
+        return arr.tolist()
+    if s.dtype.kind in 'iub':
+        return s.to_numpy().tolist()
+    return s.astype(object).where(s.notna(), None).tolist()
 
 
 def _df_to_records(df: pd.DataFrame, n: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -37,11 +246,36 @@ def _df_to_records(df: pd.DataFrame, n: Optional[int] = None) -> List[Dict[str,
         return []
     if n is not None:
         df = df.head(n)
-    return json.loads(df.to_json(orient='records'))
+    cols = [str(c) for c in df.columns]
+    arrays = [_column_values(df.iloc[:, i]) for i in range(df.shape[1])]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
 
 
-def get_top5(base_path: str = '.', n: int = 5) -> List[Dict[str, Any]]:
-    data = load_data(base_path)
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest values, largest first, without a full sort.
+
+    Matches DataFrame.nlargest(keep='first'): ties keep row order and NaNs only
+    fill the remaining slots, also in row order.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        nan = np.isnan(values)
+        if nan.any():
+            best = np.flatnonzero(~nan)[top_k_indices(values[~nan], k)]
+            return np.concatenate([best, np.flatnonzero(nan)[:max(k - best.size, 0)]])
+    k = min(k, values.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = -np.partition(-values, k - 1)[k - 1]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    idx = np.concatenate([above, ties])
+    return idx[np.argsort(-values[idx], kind='stable')]
+
+
+def get_top5(base_path: str = '.', n: int = 5,
+             _data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    data = _data if _data is not None else load_data(base_path)
     results = data.get('results_df')
     if results is None or results.empty:
         assignments = data.get('assignments_df')
@@ -51,19 +285,18 @@ def get_top5(base_path: str = '.', n: int = 5) -> List[Dict[str, Any]]:
     else:
         df = results
 
-    if 'tce' in df.columns:
-        top = df.nlargest(n, 'tce')
-    elif 'profit' in df.columns:
-        top = df.nlargest(n, 'profit')
+    key = next((c for c in ('tce', 'profit') if c in df.columns), None)
+    if key is not None:
+        top = df.iloc[top_k_indices(df[key].to_numpy(dtype=np.float64), n)]
     else:
         top = df.head(n)
 
     fields = [c for c in ['vessel', 'cargo', 'profit', 'tce', 'days'] if c in top.columns]
-    return json.loads(top[fields].to_json(orient='records'))
+    return _df_to_records(top[fields])
 
 
-def get_comparison(base_path: str = '.') -> Dict[str, Any]:
-    data = load_data(base_path)
+def get_comparison(base_path: str = '.', _data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    data = _data if _data is not None else load_data(base_path)
     assignments = data.get('assignments_df')
     if assignments is None or assignments.empty:
         return {'error': 'assignments CSV not found'}
@@ -80,51 +313,94 @@ def get_comparison(base_path: str = '.') -> Dict[str, Any]:
     }
 
 
-def get_report(base_path: str = '.', algorithm_name: str = 'greedy_tce') -> Dict[str, Any]:
-    data = load_data(base_path)
+# report key -> (assignments column, reduction); evaluated in one DataFrame.agg call
+REPORT_AGGS = {
+    'total_gross_revenue': ('gross_revenue', 'sum'),
+    'total_net_revenue': ('net_revenue', 'sum'),
+    'total_bunker_cost': ('bunker_cost', 'sum'),
+    'total_hire_cost': ('hire_cost', 'sum'),
+    'total_operating_costs': ('total_costs', 'sum'),
+    'total_profit': ('profit', 'sum'),
+    'avg_tce': ('tce', 'mean'),
+    'avg_profit_margin_pct': ('profit_margin_pct', 'mean'),
+}
+
+
+def get_report(base_path: str = '.', algorithm_name: str = 'greedy_tce',
+               _data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    data = _data if _data is not None else load_data(base_path)
     assign = data.get('assignments_df')
     results = data.get('results_df')
 
     if assign is None or assign.empty:
         return {'error': 'assignments CSV not found'}
 
+    spec = {col: func for col, func in REPORT_AGGS.values() if col in assign.columns}
+    stats = assign.agg(spec) if spec else pd.Series(dtype=float)
+    uniques = assign[[c for c in ('vessel', 'cargo') if c in assign.columns]].nunique()
+
     report = {
         'total_assignments': int(len(assign)),
-        'vessels_utilized': int(assign['vessel'].nunique()) if 'vessel' in assign.columns else None,
-        'cargoes_assigned': int(assign['cargo'].nunique()) if 'cargo' in assign.columns else None,
-        'total_gross_revenue': float(assign['gross_revenue'].sum()) if 'gross_revenue' in assign.columns else None,
-        'total_net_revenue': float(assign['net_revenue'].sum()) if 'net_revenue' in assign.columns else None,
-        'total_bunker_cost': float(assign['bunker_cost'].sum()) if 'bunker_cost' in assign.columns else None,
-        'total_hire_cost': float(assign['hire_cost'].sum()) if 'hire_cost' in assign.columns else None,
-        'total_operating_costs': float(assign['total_costs'].sum()) if 'total_costs' in assign.columns else None,
-        'total_profit': float(assign['profit'].sum()) if 'profit' in assign.columns else None,
-        'avg_tce': float(assign['tce'].mean()) if 'tce' in assign.columns else None,
-        'avg_profit_margin_pct': float(assign['profit_margin_pct'].mean()) if 'profit_margin_pct' in assign.columns else None,
-        'top5': get_top5(base_path, n=5)
+        'vessels_utilized': int(uniques['vessel']) if 'vessel' in uniques else None,
+        'cargoes_assigned': int(uniques['cargo']) if 'cargo' in uniques else None,
     }
+    for key, (col, _) in REPORT_AGGS.items():
+        report[key] = float(stats[col]) if col in stats else None
+    report['top5'] = get_top5(base_path, n=5, _data=data)
+
     scenarios = data.get('scenarios_df')
     if scenarios is not None and 'total_profit' in scenarios.columns:
+        summary = scenarios['total_profit'].agg(['min', 'median', 'max'])
         report['scenarios_summary'] = {
-            'min_profit': float(scenarios['total_profit'].min()),
-            'median_profit': float(scenarios['total_profit'].median()),
-            'max_profit': float(scenarios['total_profit'].max())
+            'min_profit': float(summary['min']),
+            'median_profit': float(summary['median']),
+            'max_profit': float(summary['max'])
         }
 
     return report
 
 
-def get_risk_report(base_path: str = '.') -> Dict[str, Any]:
-    data = load_data(base_path)
-    scenarios = data.get('scenarios_df')
-    if scenarios is None or 'total_profit' not in scenarios.columns:
-        return {'error': 'scenarios CSV not found or missing total_profit'}
-
-    profits = scenarios['total_profit'].dropna().astype(float)
-    arr = profits.to_numpy()
-    mean = float(arr.mean())
-    std = float(arr.std())
-    var_5 = float(np.percentile(arr, 5))
-    cvar_5 = float(arr[arr <= var_5].mean()) if np.any(arr <= var_5) else var_5
+def _var_cvar(arr: np.ndarray, pct: float) -> tuple:
+    """np.percentile (linear) VaR and the mean of samples at or below it, from one partition."""
+    pos = (arr.size - 1) * (pct / 100.0)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, arr.size - 1)
+    part = np.partition(arr, (lo, hi))
+    a, b = part[lo], part[hi]
+    t = pos - lo
+    # Same lerp as numpy's percentile so the result matches it exactly
+    var = b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+    # part[:lo + 1] are the lo + 1 smallest samples, all <= var; the tail only
+    # qualifies through ties with var
+    total = part[:lo + 1].sum(dtype=np.float64)
+    count = lo + 1
+    if b <= var:
+        ties = int(np.count_nonzero(part[lo + 1:] <= var))
+        total += ties * float(var)
+        count += ties
+    return float(var), float(total / count)
+
+
+def get_risk_report(base_path: str = '.', _data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    arr = None
+    if _data is None:
+        # Only total_profit is needed, so skip the DataFrame when the CSV is there
+        arr = _cached_read(os.path.join(base_path, 'freight_calculator_scenarios.csv'),
+                           _read_single_column_csv, 'total_profit', np.float32)
+    if arr is None:
+        data = _data if _data is not None else load_data(base_path)
+        scenarios = data.get('scenarios_df')
+        if scenarios is None or 'total_profit' not in scenarios.columns:
+            return {'error': 'scenarios CSV not found or missing total_profit'}
+        arr = scenarios['total_profit'].to_numpy(dtype=np.float32)
+    nan = np.isnan(arr)
+    if nan.any():
+        arr = arr[~nan]
+    if arr.size == 0:
+        return {'error': 'no total_profit samples'}
+    mean = float(arr.mean(dtype=np.float64))
+    std = float(arr.std(dtype=np.float64))
+    var_5, cvar_5 = _var_cvar(arr, 5)
     return {
         'mc_mean_profit': mean,
         'mc_std_profit': std,
@@ -136,9 +412,9 @@ def get_risk_report(base_path: str = '.') -> Dict[str, Any]:
 
 def run_all(base_path: str = '.') -> Dict[str, Any]:
     data = load_data(base_path)
-    report = get_report(base_path)
-    comparison = get_comparison(base_path)
-    risk = get_risk_report(base_path)
+    report = get_report(base_path, _data=data)
+    comparison = get_comparison(base_path, _data=data)
+    risk = get_risk_report(base_path, _data=data)
 
     return {
         'report': report,
@@ -1,14 +1,22 @@
 """Partial voyage recalculation and scenario threshold analysis."""
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # optional: fall back to the NumPy kernel
+    numba = None
+
+DAILY_HIRE = 12000
+OPEX_PER_DAY = 3000
+
 def run_partial_voyage(
     base_row: dict,
     vlsfo_price: float,
     mgo_price: float,
     speed_knots: float,
     extra_days: float,
-    daily_hire: float = 12000,
-    opex_per_day: float = 3000,
+    daily_hire: float = DAILY_HIRE,
+    opex_per_day: float = OPEX_PER_DAY,
 ):
     """Recalculate profit & TCE for partial voyage changes."""
     base_days = float(base_row.get("days", 1))
@@ -45,41 +53,297 @@ def run_partial_voyage(
         "fuel": {"vlsfo_mt": vlsfo_mt, "mgo_mt": mgo_mt},
     }
 
+def _column(base_cols, name: str, default: float, n: int, dtype=None) -> np.ndarray:
+    # Float columns keep their width (callers may hand in float32 arrays) unless dtype is forced
+    if name in base_cols:
+        arr = np.asarray(base_cols[name])
+        if dtype is None and arr.dtype.kind != "f":
+            dtype = np.float64
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+    return np.full(n, default, dtype=dtype or np.float64)
+
+
+def base_bunker_cost(base_cols, vlsfo_price: float, mgo_price: float) -> np.ndarray:
+    """Bunker cost at each row's own prices; input-independent, so callers can precompute it."""
+    n = len(base_cols["profit"])
+    f8 = np.float64
+    return _column(base_cols, "total_vlsfo_mt", 0, n, f8) * _column(base_cols, "vlsfo_price", vlsfo_price, n, f8) + \
+           _column(base_cols, "total_mgo_mt", 0, n, f8) * _column(base_cols, "mgo_price", mgo_price, n, f8)
+
+
+def _voyage_kernel_numpy(profit, base_bunker, total_vlsfo, total_mgo, days, base_speed,
+                         vlsfo_new, mgo_new, speed_new, extra_days, daily_hire, opex_per_day):
+    speed_factor = base_speed / max(speed_new, 1.0)
+    total_days = days * speed_factor + extra_days
+
+    fuel_factor = (speed_new / base_speed) ** 3
+    bunker_cost = (total_vlsfo * vlsfo_new + total_mgo * mgo_new) * fuel_factor
+    revenue = profit + base_bunker + days * (daily_hire + opex_per_day)
+
+    adj_profit = revenue - bunker_cost - total_days * (daily_hire + opex_per_day)
+    positive = total_days > 0
+    adj_tce = np.where(positive, adj_profit / np.where(positive, total_days, 1.0), 0.0)
+    return adj_profit, adj_tce, total_days
+
+
+if numba is not None:
+    # Serial on purpose: a prange kernel called from a worker thread (as Streamlit runs
+    # the script) keeps the default TBB threading layer alive and blocks interpreter exit
+    @numba.njit(fastmath=True, cache=True)
+    def voyage_kernel(profit, base_bunker, total_vlsfo, total_mgo, days, base_speed,
+                      vlsfo_new, mgo_new, speed_new, extra_days, daily_hire, opex_per_day):
+        """run_partial_voyage over 1-D float64 arrays -> (adj_profit, adj_tce, days)."""
+        n = profit.shape[0]
+        adj_profit = np.empty(n)
+        adj_tce = np.empty(n)
+        total_days = np.empty(n)
+        time_rate = daily_hire + opex_per_day
+        speed_div = max(speed_new, 1.0)
+        for i in range(n):
+            t = days[i] * base_speed[i] / speed_div + extra_days
+            fuel_factor = (speed_new / base_speed[i]) ** 3
+            bunker_cost = (total_vlsfo[i] * vlsfo_new + total_mgo[i] * mgo_new) * fuel_factor
+            p = profit[i] + base_bunker[i] + days[i] * time_rate - bunker_cost - t * time_rate
+            adj_profit[i] = p
+            adj_tce[i] = p / t if t > 0 else 0.0
+            total_days[i] = t
+        return adj_profit, adj_tce, total_days
+else:
+    voyage_kernel = _voyage_kernel_numpy
+
+
+def run_partial_voyage_batch(
+    base_cols,
+    vlsfo_price: float,
+    mgo_price: float,
+    speed_knots: float,
+    extra_days: float,
+    daily_hire: float = DAILY_HIRE,
+    opex_per_day: float = OPEX_PER_DAY,
+    fuel: bool = True,
+):
+    """Vectorized run_partial_voyage over every row of a DataFrame (or dict of arrays).
+
+    A precomputed ``base_bunker_cost`` column is used when present. Pass
+    ``fuel=False`` to skip the per-row fuel arrays when only profit/TCE are needed.
+    """
+    n = len(base_cols["profit"])
+    base_days = _column(base_cols, "days", 1, n)
+    base_vlsfo_mt = _column(base_cols, "total_vlsfo_mt", 0, n)
+    base_mgo_mt = _column(base_cols, "total_mgo_mt", 0, n)
+    base_speed = _column(base_cols, "speed_knots", 12, n)
+
+    if "base_bunker_cost" in base_cols:
+        base_bunker = np.asarray(base_cols["base_bunker_cost"], dtype=np.float64)
+    else:
+        base_bunker = base_bunker_cost(base_cols, vlsfo_price, mgo_price)
+
+    profit, tce, total_days = voyage_kernel(
+        _column(base_cols, "profit", 0, n, np.float64),
+        base_bunker,
+        base_vlsfo_mt,
+        base_mgo_mt,
+        base_days,
+        base_speed,
+        float(vlsfo_price),
+        float(mgo_price),
+        float(speed_knots),
+        float(extra_days),
+        float(daily_hire),
+        float(opex_per_day),
+    )
+
+    result = {
+        "profit": profit,
+        "adj_profit": profit,
+        "tce": tce,
+        "adj_tce": tce,
+        "days": total_days,
+    }
+    if fuel:
+        fuel_factor = (speed_knots / base_speed) ** 3
+        result["fuel"] = {"vlsfo_mt": base_vlsfo_mt * fuel_factor, "mgo_mt": base_mgo_mt * fuel_factor}
+    return result
+
 # ---------------- Threshold Analysis ----------------
+# Max elements per (steps x rows) broadcast block, to bound memory on large tables
+_BROADCAST_BLOCK = 1 << 22
+_VOYAGE_COLS = ("days", "profit", "total_vlsfo_mt", "total_mgo_mt", "speed_knots", "vlsfo_price", "mgo_price")
+
+
+def _voyage_columns(results_df):
+    """Float64 arrays of the columns run_partial_voyage reads (views for float64 columns)."""
+    return {c: results_df[c].to_numpy(dtype=np.float64) for c in _VOYAGE_COLS if c in results_df.columns}
+
+
+def _profits_list(vessels, cargos, profit):
+    return [{"vessel": v, "cargo": c, "profit": p} for v, c, p in zip(vessels, cargos, profit.tolist())]
+
+
+# Both searches sweep a single input along a grid, and each row's profit is affine
+# in it: profit[step, row] = const[row] - rate[row] * values[step].
+def _first_crossing_numpy(const, rate, values, is_current, base_profit, epsilon):
+    block = max(1, _BROADCAST_BLOCK // max(const.size, 1))
+    # One (block x rows) buffer, filled in place for every block
+    buf = np.empty((min(block, values.size), const.size))
+    for lo in range(0, values.size, block):
+        chunk = values[lo:lo + block]
+        profits2d = buf[:chunk.size]
+        np.multiply(chunk[:, None], rate[None, :], out=profits2d)
+        np.subtract(const[None, :], profits2d, out=profits2d)
+        top_idx = profits2d.argmax(axis=1)
+        top_profit = profits2d[np.arange(top_idx.size), top_idx]
+        hits = np.flatnonzero(~is_current[top_idx] & (np.abs(top_profit - base_profit) > epsilon))
+        if hits.size:
+            s = int(hits[0])
+            return lo + s, int(top_idx[s]), float(top_profit[s])
+    return -1, -1, 0.0
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _first_crossing(const, rate, values, is_current, base_profit, epsilon):
+        """First step whose best row is not the current one and differs by > epsilon -> (step, row, profit)."""
+        n = const.shape[0]
+        if n == 0:
+            return -1, -1, 0.0
+        for s in range(values.shape[0]):
+            v = values[s]
+            best = 0
+            best_profit = const[0] - rate[0] * v
+            for i in range(1, n):
+                p = const[i] - rate[i] * v
+                if p > best_profit:
+                    best = i
+                    best_profit = p
+            if not is_current[best] and abs(best_profit - base_profit) > epsilon:
+                return s, best, best_profit
+        return -1, -1, 0.0
+
+    # Compile (or load from the on-disk cache) now rather than on the first search
+    _first_crossing(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.bool_), 0.0, 1.0)
+else:
+    _first_crossing = _first_crossing_numpy
+
+
+def _bisect_crossing(const, rate, values, is_current, base_profit, epsilon):
+    """_first_crossing in O(log steps) single-step sweeps, or None when that is not exact.
+
+    With rate >= 0 and increasing values the best profit only falls. A single current
+    row is the best on an interval of the grid, so once it loses the lead it never gets
+    it back. If its starting profit is within epsilon above base_profit, every later
+    step also satisfies the profit test. Under those conditions, crossing is monotone
+    in the step and can be bisected.
+    """
+    if values.size < 3 or np.count_nonzero(is_current) != 1 or np.any(rate < 0) \
+            or np.any(np.diff(values) < 0):
+        return None
+    first = _first_crossing(const, rate, values[:1], is_current, base_profit, epsilon)
+    if first[0] >= 0:
+        return first
+    start = const - rate * values[0]
+    top = int(start.argmax())
+    if not is_current[top] or start[top] > base_profit + epsilon:
+        return None
+
+    hit = _first_crossing(const, rate, values[-1:], is_current, base_profit, epsilon)
+    if hit[0] < 0:
+        return -1, -1, 0.0
+    lo, hi = 0, values.size - 1  # lo never crosses, hi does
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        res = _first_crossing(const, rate, values[mid:mid + 1], is_current, base_profit, epsilon)
+        if res[0] >= 0:
+            hi, hit = mid, res
+        else:
+            lo = mid
+    return hi, hit[1], hit[2]
+
+
+def _first_crossing_uniform(const, rate, values, is_current, base_profit, epsilon):
+    """_first_crossing for one rate shared by every row (a scalar).
+
+    Shifting all rows by the same amount keeps their order, so the best row is
+    argmax(const) at every step and only its profit moves along the grid: O(rows + steps).
+    """
+    if const.size == 0:
+        return -1, -1, 0.0
+    best = int(const.argmax())
+    if is_current[best]:
+        return -1, -1, 0.0
+    profits = const[best] - rate * values
+    hits = np.flatnonzero(np.abs(profits - base_profit) > epsilon)
+    if hits.size == 0:
+        return -1, -1, 0.0
+    return int(hits[0]), best, float(profits[hits[0]])
+
+
+def _matches(col, value):
+    """Boolean mask of col == value; compares integer codes for categorical columns."""
+    if hasattr(col, "cat"):
+        cats = col.cat.categories
+        if value not in cats:
+            return np.zeros(len(col), dtype=np.bool_)
+        return col.cat.codes.to_numpy() == cats.get_loc(value)
+    return np.asarray(col.to_numpy() == value, dtype=np.bool_)
+
+
+def _search(results_df, current_vessel, current_cargo, base_profit, const, rate, values):
+    is_current = _matches(results_df["vessel"], current_vessel) & _matches(results_df["cargo"], current_cargo)
+    epsilon = 1e-3  # tolerance
+
+    if np.ndim(rate) == 0:
+        res = _first_crossing_uniform(const, float(rate), values, is_current, float(base_profit), epsilon)
+    else:
+        res = _bisect_crossing(const, rate, values, is_current, float(base_profit), epsilon)
+    if res is None:
+        res = _first_crossing(const, rate, values, is_current, float(base_profit), epsilon)
+    step, best, best_profit = res
+    if step < 0:
+        return None, None, None
+    # Labels are only materialised once a crossing is found
+    vessels = results_df["vessel"].to_numpy()
+    cargos = results_df["cargo"].to_numpy()
+    top_choice = {"vessel": vessels[best], "cargo": cargos[best], "profit": float(best_profit)}
+    return step, top_choice, _profits_list(vessels, cargos, const - values[step] * rate)
+
+
 def find_delay_threshold(base_row, results_df, vlsfo_price, mgo_price,
                          speed_knots, extra_days_start=0.0, extra_days_end=30.0, step=0.5):
-    current_vessel = base_row["vessel"]
-    current_cargo = base_row["cargo"]
     base_result = run_partial_voyage(base_row, vlsfo_price, mgo_price, speed_knots, extra_days_start)
-    base_profit = base_result["profit"]
-    epsilon = 1e-3  # tolerance
+    cols = _voyage_columns(results_df)
 
-    for delay_days in np.arange(extra_days_start, extra_days_end + step, step):
-        profits = []
-        for _, row in results_df.iterrows():
-            result = run_partial_voyage(row.to_dict(), vlsfo_price, mgo_price, speed_knots, delay_days)
-            profits.append({"vessel": row["vessel"], "cargo": row["cargo"], "profit": result["profit"]})
-        top_choice = max(profits, key=lambda x: x["profit"])
-        if (top_choice["vessel"] != current_vessel or top_choice["cargo"] != current_cargo) and abs(top_choice["profit"] - base_profit) > epsilon:
-            return delay_days, top_choice, profits
-    return None, None, None
+    # Speed is fixed, so only the time cost depends on the delay, at the same daily rate for every row
+    delays = np.arange(extra_days_start, extra_days_end + step, step)
+    const = run_partial_voyage_batch(cols, vlsfo_price, mgo_price, speed_knots, 0.0, fuel=False)["profit"]
+    rate = float(DAILY_HIRE + OPEX_PER_DAY)
+
+    idx, top_choice, profits = _search(results_df, base_row["vessel"], base_row["cargo"],
+                                       base_result["profit"], const, rate, delays)
+    if idx is None:
+        return None, None, None
+    return delays[idx], top_choice, profits
 
 def find_bunker_price_threshold(base_row, results_df, vlsfo_price, mgo_price,
                                 speed_knots, extra_days, price_increase_start=0.0,
                                 price_increase_end=200.0, step=1.0):
-    current_vessel = base_row["vessel"]
-    current_cargo = base_row["cargo"]
     base_result = run_partial_voyage(base_row, vlsfo_price, mgo_price, speed_knots, extra_days)
-    base_profit = base_result["profit"]
-    epsilon = 1e-3  # tolerance
+    cols = _voyage_columns(results_df)
+    # Rows without their own vlsfo_price fall back to the swept price (0 here) in the base cost
+    cols["base_bunker_cost"] = base_bunker_cost(cols, 0.0, mgo_price)
+
+    # Profit falls linearly in the VLSFO price, by each row's speed-adjusted VLSFO tonnage;
+    # without a vlsfo_price column the base bunker cost tracks the sweep too and offsets it
+    pct_increases = np.arange(price_increase_start, price_increase_end + step, step)
+    new_vlsfo_prices = vlsfo_price * (1 + pct_increases / 100)
+    batch = run_partial_voyage_batch(cols, 0.0, mgo_price, speed_knots, extra_days)
+    const = batch["profit"]
+    rate = batch["fuel"]["vlsfo_mt"]
+    if "vlsfo_price" not in cols:
+        rate = rate - cols.get("total_vlsfo_mt", 0.0)
 
-    for pct_increase in np.arange(price_increase_start, price_increase_end + step, step):
-        new_vlsfo_price = vlsfo_price * (1 + pct_increase / 100)
-        profits = []
-        for _, row in results_df.iterrows():
-            result = run_partial_voyage(row.to_dict(), new_vlsfo_price, mgo_price, speed_knots, extra_days)
-            profits.append({"vessel": row["vessel"], "cargo": row["cargo"], "profit": result["profit"]})
-        top_choice = max(profits, key=lambda x: x["profit"])
-        if (top_choice["vessel"] != current_vessel or top_choice["cargo"] != current_cargo) and abs(top_choice["profit"] - base_profit) > epsilon:
-            return pct_increase, top_choice, profits
-    return None, None, None
+    idx, top_choice, profits = _search(results_df, base_row["vessel"], base_row["cargo"],
+                                       base_result["profit"], const, rate, new_vlsfo_prices)
+    if idx is None:
+        return None, None, None
+    return pct_increases[idx], top_choice, profits